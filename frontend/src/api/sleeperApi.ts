@@ -1,4 +1,4 @@
-import type { RankedTeam, TrendData, StandingsResponse } from '../types';
+import type { RankedTeam, TrendData, StandingsResponse, SeasonBundle } from '../types';
 
 const BASE_URL = import.meta.env.VITE_API_BASE_URL || 'http://localhost:8000';
 
@@ -14,8 +14,128 @@ export const fetchTeamTrends = async (leagueId: string, ownerName: string, curre
     return response.json();
 };
 
+// Streams one trend point per week as soon as the backend has it. Returns a function that closes the stream.
+export const streamTeamTrends = (
+    leagueId: string,
+    ownerName: string,
+    currentWeek: number,
+    onPoint: (point: TrendData) => void,
+    onDone: () => void,
+    onError: (message: string) => void,
+): (() => void) => {
+    const source = new EventSource(`${BASE_URL}/trends/${leagueId}/${ownerName}/${currentWeek}/stream`);
+    source.onmessage = (event) => onPoint(JSON.parse(event.data));
+    source.addEventListener('end', () => {
+        source.close();
+        onDone();
+    });
+    // Fires both for connection failures and for the backend's own `event: error` frames
+    source.onerror = (event) => {
+        source.close();
+        const detail = event instanceof MessageEvent && event.data ? JSON.parse(event.data).detail : null;
+        onError(detail || 'Failed to stream trends');
+    };
+    return () => source.close();
+};
+
 export const fetchStandings = async (leagueId: string, week: number, userRosterId: number, targetRosterId: number): Promise<StandingsResponse> => {
     const response = await fetch(`${BASE_URL}/standings/${leagueId}/${week}/${userRosterId}/${targetRosterId}`);
     if (!response.ok) throw new Error('Failed to fetch standings');
     return response.json();
 };
+
+// Latest bundle request per league, shared by every caller while it is in flight
+interface CachedSeasonBundle {
+    week: number;
+    fetchedAt: number;
+    inFlight: boolean;
+    promise: Promise<SeasonBundle>;
+}
+
+// Scores and projections move during a live week, so cached bundles are only trusted briefly
+const SEASON_BUNDLE_TTL_MS = 60_000;
+const seasonBundleCache = new Map<string, CachedSeasonBundle>();
+
+// Reuses a cached bundle that covers `week` (week-selector changes). Pass refresh to force a new
+// request (search buttons), which still joins a request that is already in flight.
+export const fetchSeasonBundle = (leagueId: string, week: number, refresh = false): Promise<SeasonBundle> => {
+    const cached = seasonBundleCache.get(leagueId);
+    const isFresh = cached && Date.now() - cached.fetchedAt < SEASON_BUNDLE_TTL_MS;
+    if (cached && cached.week >= week && (cached.inFlight || (isFresh && !refresh))) return cached.promise;
+
+    const request = fetch(`${BASE_URL}/season/${leagueId}/${week}`).then(async (response) => {
+        if (!response.ok) throw new Error('Failed to fetch season');
+        return (await response.json()) as SeasonBundle;
+    });
+    const entry: CachedSeasonBundle = { week, fetchedAt: Date.now(), inFlight: true, promise: request };
+    request.then(
+        () => {
+            entry.inFlight = false;
+        },
+        () => {
+            // Don't keep failures around for the next caller
+            entry.inFlight = false;
+            if (seasonBundleCache.get(leagueId) === entry) seasonBundleCache.delete(leagueId);
+        },
+    );
+    seasonBundleCache.set(leagueId, entry);
+    return request;
+};
+
+// Rebuilds the /rankings response for a single week from the bundle
+export const rankingsForWeek = (bundle: SeasonBundle, week: number): RankedTeam[] => {
+    const w = week - 1;
+    return bundle.roster_ids
+        .map((rosterId, i) => ({
+            rank: bundle.rankings.rank[w][i],
+            roster_id: rosterId,
+            owner_name: bundle.owner_names[i],
+            power_index: bundle.rankings.power_index[w][i],
+            z_points: bundle.rankings.z_points[w][i],
+            z_all_play_wins: bundle.rankings.z_all_play_wins[w][i],
+            z_projected_points: bundle.rankings.z_projected_points[w][i],
+        }))
+        .sort((a, b) => a.rank - b.rank);
+};
+
+// Rebuilds the /standings response for a single week from the bundle
+export const standingsForWeek = (bundle: SeasonBundle, week: number, userRosterId: number, targetRosterId: number): StandingsResponse => {
+    const w = week - 1;
+
+    const regular = bundle.roster_ids
+        .map((_, i) => ({
+            owner_name: bundle.owner_names[i],
+            wins: bundle.regular.wins[w][i],
+            losses: bundle.regular.losses[w][i],
+            ties: bundle.regular.ties[w][i],
+            points: bundle.regular.points[w][i],
+            opponent_points: bundle.regular.opponent_points[w][i],
+            win_pct: bundle.regular.win_pct[w][i],
+        }))
+        .sort((a, b) => b.wins - a.wins || b.points - a.points);
+
+    const all_play = bundle.roster_ids
+        .map((_, i) => ({
+            owner_name: bundle.owner_names[i],
+            all_play_wins: bundle.all_play.all_play_wins[w][i],
+            all_play_losses: bundle.all_play.all_play_losses[w][i],
+            win_pct: bundle.all_play.win_pct[w][i],
+        }))
+        .sort((a, b) => b.all_play_wins - a.all_play_wins || a.all_play_losses - b.all_play_losses);
+
+    // Rival record is every week's points head to head, up to and including this week
+    const u = bundle.roster_ids.indexOf(userRosterId);
+    const r = bundle.roster_ids.indexOf(targetRosterId);
+    const rival = { owner_name: bundle.owner_names[u], rival_name: bundle.owner_names[r], wins: 0, losses: 0, ties: 0, points_user: 0, points_rival: 0 };
+    for (const weekPoints of bundle.weekly_points.slice(0, week)) {
+        const userPoints = weekPoints[u];
+        const rivalPoints = weekPoints[r];
+        if (userPoints > rivalPoints) rival.wins += 1;
+        else if (userPoints < rivalPoints) rival.losses += 1;
+        else rival.ties += 1;
+        rival.points_user += userPoints;
+        rival.points_rival += rivalPoints;
+    }
+
+    return { regular, all_play, rivals: [rival] };
+};
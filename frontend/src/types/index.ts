@@ -45,4 +45,35 @@ export interface StandingsResponse {
     regular: RegularStanding[];
     all_play: AllWinsStanding[];
     rivals: RivalStanding[];
-}
\ No newline at end of file
+}
+// Columnar season data: every metric is [week][team], with teams in the order of roster_ids
+export interface SeasonBundle {
+    weeks: number[];
+    roster_ids: number[];
+    owner_names: string[];
+    weekly_points: number[][];
+    rankings: {
+        rank: number[][];
+        power_index: number[][];
+        z_points: number[][];
+        z_all_play_wins: number[][];
+        z_projected_points: number[][];
+    };
+    trends: {
+        rank: number[][];
+        power_index: number[][];
+    };
+    regular: {
+        wins: number[][];
+        losses: number[][];
+        ties: number[][];
+        points: number[][];
+        opponent_points: number[][];
+        win_pct: number[][];
+    };
+    all_play: {
+        all_play_wins: number[][];
+        all_play_losses: number[][];
+        win_pct: number[][];
+    };
+}
@@ -1,19 +1,18 @@
 import httpx
 import asyncio
+from src.api_clients.transports import HttpxTransport
 
 class SleeperAPIClient:
-    def __init__(self):
+    def __init__(self, transport=None):
         self.base_url = "https://api.sleeper.app/v1"
         self.timeout = httpx.Timeout(30.0)
         self.semaphore = asyncio.Semaphore(5)
+        # Transport does the actual I/O, so recorded responses can be swapped in for load testing
+        self.transport = transport or HttpxTransport(self.timeout)
 
     async def _fetch(self, endpoint: str):
         async with self.semaphore:
-            # Using async with here ensures connections are cleanly closed so we don't leak memory
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.get(f"{self.base_url}/{endpoint}")
-                response.raise_for_status()  # Instantly catches any bad responses from Sleeper
-                return response.json()
+            return await self.transport.fetch(f"{self.base_url}/{endpoint}", endpoint)
 
     async def get_league_info(self, league_id: str):
         return await self._fetch(f"league/{league_id}")
@@ -0,0 +1,105 @@
+import httpx
+import asyncio
+import json
+import os
+import random
+from pathlib import Path
+
+
+class HttpxTransport:
+    # Default transport: talks to the live Sleeper API
+    def __init__(self, timeout: httpx.Timeout = None):
+        self.timeout = timeout or httpx.Timeout(30.0)
+
+    async def fetch(self, url: str, endpoint: str):
+        # Using async with here ensures connections are cleanly closed so we don't leak memory
+        async with httpx.AsyncClient(timeout=self.timeout) as client:
+            response = await client.get(url)
+            response.raise_for_status()  # Instantly catches any bad responses from Sleeper
+            return response.json()
+
+
+def recording_path(directory, endpoint: str):
+    # Each endpoint is stored as its own file, e.g. league/123/matchups/1 -> league/123/matchups/1.json
+    return Path(directory) / f"{endpoint.strip('/')}.json"
+
+
+class RecordingTransport:
+    # Wraps another transport and writes every successful response to disk for later replay
+    def __init__(self, directory, inner=None):
+        self.directory = Path(directory)
+        self.inner = inner or HttpxTransport()
+
+    async def fetch(self, url: str, endpoint: str):
+        data = await self.inner.fetch(url, endpoint)
+
+        path = recording_path(self.directory, endpoint)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(data))
+
+        return data
+
+
+class ReplayTransport:
+    # Serves recorded responses from disk with optional latency, jitter and injected errors
+    def __init__(self, directory, latency: float = 0.0, jitter: float = 0.0, error_rate: float = 0.0, seed: int = None):
+        self.directory = Path(directory)
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.random = random.Random(seed)
+        self._cache = {}
+
+    def _load(self, endpoint: str):
+        if endpoint not in self._cache:
+            path = recording_path(self.directory, endpoint)
+            if not path.exists():
+                raise FileNotFoundError(f"No recording for '{endpoint}' in {self.directory}")
+            self._cache[endpoint] = path.read_text()
+
+        # Parse on every call so callers can never mutate the cached payload
+        return json.loads(self._cache[endpoint])
+
+    async def fetch(self, url: str, endpoint: str):
+        delay = max(0.0, self.latency + self.random.uniform(-self.jitter, self.jitter))
+        if delay:
+            await asyncio.sleep(delay)
+
+        if self.error_rate and self.random.random() < self.error_rate:
+            # Mimic an upstream outage so the app sees the same exception type as a live failure
+            request = httpx.Request("GET", url)
+            response = httpx.Response(503, request=request)
+            raise httpx.HTTPStatusError("Injected error from ReplayTransport", request=request, response=response)
+
+        return self._load(endpoint)
+
+
+def transport_from_env():
+    """
+    Builds a transport from environment variables so the app can be pointed at
+    recorded data without code changes.
+
+    SLEEPER_TRANSPORT: 'live' (default), 'record' or 'replay'
+    SLEEPER_RECORDINGS_DIR: where recordings are written to / read from
+    SLEEPER_REPLAY_LATENCY, SLEEPER_REPLAY_JITTER: seconds added to each replayed request
+    SLEEPER_REPLAY_ERROR_RATE: fraction of replayed requests that fail with a 503
+    SLEEPER_REPLAY_SEED: seed for jitter and error injection
+    """
+    mode = os.getenv("SLEEPER_TRANSPORT", "live").lower()
+    directory = os.getenv("SLEEPER_RECORDINGS_DIR", "recordings")
+
+    if mode == "live":
+        return HttpxTransport()
+    if mode == "record":
+        return RecordingTransport(directory)
+    if mode == "replay":
+        seed = os.getenv("SLEEPER_REPLAY_SEED")
+        return ReplayTransport(
+            directory,
+            latency=float(os.getenv("SLEEPER_REPLAY_LATENCY", 0)),
+            jitter=float(os.getenv("SLEEPER_REPLAY_JITTER", 0)),
+            error_rate=float(os.getenv("SLEEPER_REPLAY_ERROR_RATE", 0)),
+            seed=int(seed) if seed is not None else None,
+        )
+
+    raise ValueError(f"Unknown SLEEPER_TRANSPORT '{mode}', expected 'live', 'record' or 'replay'")
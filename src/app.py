@@ -1,8 +1,11 @@
+import json
 import pandas as pd
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import StreamingResponse
 from src.api_clients.sleeper import SleeperAPIClient
-from src.utils.calculations import create_rosters_map, create_users_map, process_matchups_data, get_true_record, get_power_rankings, calculate_trend_lines, get_projections, calculate_season_aggregates, calculate_weekly_regular_standings, calculate_all_wins_standings, calculate_rival_standings
+from src.api_clients.transports import transport_from_env
+from src.utils.calculations import create_rosters_map, create_users_map, process_matchups_data, get_true_record, get_power_rankings, calculate_trend_lines, calculate_trend_point, get_projections, calculate_season_aggregates, calculate_weekly_regular_standings, calculate_all_wins_standings, calculate_rival_standings, calculate_season_bundle
 import asyncio
 import uvicorn
 from dotenv import load_dotenv
@@ -23,7 +26,8 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-client = SleeperAPIClient()
+# SLEEPER_TRANSPORT=record/replay lets the app run against recorded Sleeper responses
+client = SleeperAPIClient(transport=transport_from_env())
 
 async def fetch_base_league_data(league_id: str):
     league_info, users_data = await asyncio.gather(
@@ -47,6 +51,35 @@ async def fetch_projections_up_to_week(season: str, current_week: int):
     projections = await asyncio.gather(*tasks)
     return projections
 
+async def stream_weeks_up_to_week(league_id: str, season: str, current_week: int):
+    # Every week's requests are started up front (the client semaphore still throttles them),
+    # but results are handed back strictly in week order so callers can process them as they land.
+    # Tasks are queued as matchup/projection pairs per week so week 1 is first through the semaphore.
+    week_tasks = [
+        (
+            asyncio.create_task(client.get_matchups(league_id, wk)),
+            asyncio.create_task(client.get_weekly_projections(season, wk)),
+        )
+        for wk in range(1, current_week + 1)
+    ]
+    
+    try:
+        for wk_idx, (matchup_task, projection_task) in enumerate(week_tasks):
+            wk_matchups, wk_projections = await asyncio.gather(matchup_task, projection_task)
+            yield wk_idx + 1, wk_matchups, wk_projections
+    finally:
+        # Stops outstanding fetches if the client disconnects or a week fails part way through the stream
+        for task in [task for pair in week_tasks for task in pair]:
+            if not task.done():
+                task.cancel()
+            elif not task.cancelled():
+                task.exception()  # Marks failures we never awaited as retrieved
+
+def format_sse_event(data, event: str = None):
+    # Helper to frame a payload as a single Server-Sent Event
+    message = f"event: {event}\n" if event else ""
+    return message + f"data: {json.dumps(data)}\n\n"
+
 def format_df_to_json(df: pd.DataFrame):
     # Helper to safely convert a Pandas DataFrame into a List of Dictionaries 
     # so FastAPI can return it as JSON to the frontend.
@@ -127,6 +160,90 @@ async def fetch_team_trends(league_id: str, target_owner_name: str, week: int):
     
     return format_df_to_json(trend_df)
 
+@app.get("/trends/{league_id}/{target_owner_name}/{week}/stream")
+async def stream_team_trends(league_id: str, target_owner_name: str, week: int):
+    league_data, rosters_data = await asyncio.gather(
+        fetch_base_league_data(league_id),
+        client.get_league_rosters(league_id),
+    )
+    season = league_data["league_info"]["season"]
+    total_rosters = league_data["league_info"].get("total_rosters", 10)
+    
+    user_map = create_users_map(league_data["users"])
+    roster_map = create_rosters_map(rosters_data)
+    
+    target_user_id = next((uid for uid, name in user_map.items() if name == target_owner_name), None)
+    target_roster_id = next((rid for rid, uid in roster_map.items() if uid == target_user_id), None)
+    
+    async def event_stream():
+        season_dfs = []
+        proj_dfs = []
+        
+        try:
+            async for wk, wk_matchups, wk_projections in stream_weeks_up_to_week(league_id, season, week):
+                df = pd.DataFrame(wk_matchups)
+                df['week'] = wk
+                # Ranks and z-scores are computed per week, so each week can be processed on its own
+                season_dfs.append(process_matchups_data([df], total_rosters))
+                
+                proj_df = get_projections(league_data["league_info"], wk_matchups, wk_projections)
+                proj_df['week'] = wk
+                proj_dfs.append(proj_df)
+                
+                season_df = pd.concat(season_dfs, ignore_index=True)
+                projections_df = pd.concat(proj_dfs, ignore_index=True)
+                
+                point = calculate_trend_point(season_df, projections_df, target_roster_id, wk)
+                if point is not None:
+                    yield format_sse_event(point)
+        except Exception as e:
+            # Headers are already sent, so report the failure in-band instead of dropping the connection
+            yield format_sse_event({"detail": f"Failed to load week data: {e}"}, event="error")
+            return
+        
+        yield format_sse_event({"weeks": week}, event="end")
+    
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+@app.get("/season/{league_id}/{week}")
+async def fetch_season_bundle(league_id: str, week: int):
+    league_data = await fetch_base_league_data(league_id)
+    season = league_data["league_info"]["season"]
+    total_rosters = league_data["league_info"].get("total_rosters", 10)
+    
+    rosters_data, projections_to_week, matchups_up_to_week = await asyncio.gather(
+        client.get_league_rosters(league_id),
+        fetch_projections_up_to_week(season, week),
+        fetch_matchups_up_to_week(league_id, week),
+    )
+    
+    matchup_dfs = []
+    proj_dfs = []
+    for wk_idx, (wk_matchups, wk_projections) in enumerate(zip(matchups_up_to_week, projections_to_week)):
+        df = pd.DataFrame(wk_matchups)
+        df['week'] = wk_idx + 1
+        matchup_dfs.append(df)
+        
+        proj_df = get_projections(league_data["league_info"], wk_matchups, wk_projections)
+        proj_df['week'] = wk_idx + 1
+        proj_dfs.append(proj_df)
+    
+    season_df = process_matchups_data(matchup_dfs, total_rosters)
+    projections_df = pd.concat(proj_dfs, ignore_index=True)
+    
+    # Every week 1..N in one response so the frontend can switch weeks without another round trip
+    bundle = calculate_season_bundle(season_df, projections_df)
+    
+    user_map = create_users_map(league_data["users"])
+    roster_map = create_rosters_map(rosters_data)
+    bundle['owner_names'] = [user_map.get(roster_map.get(rid)) for rid in bundle['roster_ids']]
+    
+    return bundle
+
 @app.get("/standings/{league_id}/{week}/{user_roster_id}/{target_roster_id}")
 async def fetch_standings(league_id: str, week: int, user_roster_id: str, target_roster_id: str):
 
@@ -0,0 +1,225 @@
+"""
+Offline load generator for the power rankings API.
+
+Drives the FastAPI app with a weighted mix of /rankings, /trends, /standings and
+/season requests and reports throughput plus p50/p95/p99 latency per route. The app
+runs in-process against Sleeper responses replayed from disk, so changes to
+concurrency and caching can be compared without touching api.sleeper.app.
+
+Record every endpoint the routes need for weeks 1..N once (hits the live API):
+    python -m src.load_test --league-id 123 --week 10 --record-dir recordings
+
+Then replay it as often as needed:
+    python -m src.load_test --league-id 123 --week 10 --replay-dir recordings --latency 0.08 --jitter 0.03
+
+Without --replay-dir the transport comes from SLEEPER_TRANSPORT, which must be set
+explicitly; SLEEPER_TRANSPORT=live sends all traffic to api.sleeper.app.
+"""
+import argparse
+import asyncio
+import os
+import random
+import sys
+import time
+from urllib.parse import quote
+
+import httpx
+import numpy as np
+
+import src.app as app_module
+from src.api_clients.sleeper import SleeperAPIClient
+from src.api_clients.transports import HttpxTransport, RecordingTransport, ReplayTransport, transport_from_env
+
+
+DEFAULT_MIX = {"rankings": 5, "trends": 3, "standings": 2, "season": 1}
+
+
+def parse_mix(mix: str):
+    # "rankings=5,trends=3,standings=2" -> {'rankings': 5, 'trends': 3, 'standings': 2}
+    weights = {}
+    for part in mix.split(","):
+        route, weight = part.split("=")
+        route = route.strip()
+        if route not in DEFAULT_MIX:
+            raise ValueError(f"Unknown route '{route}', expected one of {sorted(DEFAULT_MIX)}")
+        weights[route] = float(weight)
+    return weights
+
+
+def build_request_paths(league_id: str, max_week: int, owner_names, roster_ids, mix, total_requests: int, seed: int = None):
+    # Picks a route per request by weight, then a random week / owner / rival pair for it
+    rng = random.Random(seed)
+    routes = list(mix)
+    weights = [mix[r] for r in routes]
+
+    paths = []
+    for route in rng.choices(routes, weights=weights, k=total_requests):
+        wk = rng.randint(1, max_week)
+        if route == "rankings":
+            path = f"/rankings/{league_id}/{wk}"
+        elif route == "season":
+            path = f"/season/{league_id}/{wk}"
+        elif route == "trends":
+            path = f"/trends/{league_id}/{quote(rng.choice(owner_names))}/{wk}"
+        else:
+            user_roster_id, target_roster_id = rng.sample(roster_ids, 2)
+            path = f"/standings/{league_id}/{wk}/{user_roster_id}/{target_roster_id}"
+        paths.append((route, path))
+
+    return paths
+
+
+async def run_load(http_client: httpx.AsyncClient, paths, concurrency: int):
+    # Fixed pool of workers pulling from a shared queue keeps `concurrency` requests in flight
+    queue = asyncio.Queue()
+    for item in paths:
+        queue.put_nowait(item)
+
+    results = []
+
+    async def worker():
+        while True:
+            try:
+                route, path = queue.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+
+            start = time.perf_counter()
+            try:
+                response = await http_client.get(path)
+                status = response.status_code
+            except Exception:
+                status = None
+            results.append({"route": route, "status": status, "latency": time.perf_counter() - start})
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - start
+
+    return results, elapsed
+
+
+def summarize(results, elapsed: float):
+    # Returns one row per route plus an 'all' row with throughput and latency percentiles in ms
+    summary = []
+    routes = sorted({r["route"] for r in results}) + ["all"]
+
+    for route in routes:
+        rows = [r for r in results if route == "all" or r["route"] == route]
+        latencies = np.array([r["latency"] for r in rows]) * 1000
+        p50, p95, p99 = np.percentile(latencies, [50, 95, 99])
+
+        summary.append({
+            "route": route,
+            "requests": len(rows),
+            "errors": sum(1 for r in rows if r["status"] != 200),
+            "throughput": round(len(rows) / elapsed, 2) if elapsed else 0.0,
+            "p50_ms": round(float(p50), 2),
+            "p95_ms": round(float(p95), 2),
+            "p99_ms": round(float(p99), 2),
+        })
+
+    return summary
+
+
+def print_summary(summary, elapsed: float):
+    print(f"Completed in {elapsed:.2f}s")
+    print(f"{'route':<10} {'requests':>8} {'errors':>7} {'req/s':>8} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9}")
+    for row in summary:
+        print(
+            f"{row['route']:<10} {row['requests']:>8} {row['errors']:>7} {row['throughput']:>8} "
+            f"{row['p50_ms']:>9} {row['p95_ms']:>9} {row['p99_ms']:>9}"
+        )
+
+
+async def record_league(sleeper: SleeperAPIClient, league_id: str, max_week: int):
+    # Fetches every endpoint the routes can touch for weeks 1..max_week, so any replayed mix is covered
+    league_info, _, _ = await asyncio.gather(
+        sleeper.get_league_info(league_id),
+        sleeper.get_league_users(league_id),
+        sleeper.get_league_rosters(league_id),
+    )
+    season = league_info["season"]
+
+    await asyncio.gather(
+        *(sleeper.get_matchups(league_id, wk) for wk in range(1, max_week + 1)),
+        *(sleeper.get_weekly_projections(season, wk) for wk in range(1, max_week + 1)),
+    )
+
+
+async def main(args):
+    if args.record_dir:
+        await record_league(SleeperAPIClient(transport=RecordingTransport(args.record_dir)), args.league_id, args.week)
+        print(f"Recorded league {args.league_id} weeks 1-{args.week} to {args.record_dir}")
+        return None
+
+    if args.replay_dir:
+        transport = ReplayTransport(
+            args.replay_dir,
+            latency=args.latency,
+            jitter=args.jitter,
+            error_rate=args.error_rate,
+            seed=args.seed,
+        )
+    else:
+        transport = transport_from_env()
+
+    if isinstance(transport, HttpxTransport) or isinstance(getattr(transport, "inner", None), HttpxTransport):
+        print("WARNING: SLEEPER_TRANSPORT sends this load test's traffic to the live api.sleeper.app", file=sys.stderr)
+
+    sleeper = SleeperAPIClient(transport=transport)
+
+    # Owners and rosters are discovered through the same transport the app will use
+    users, rosters = await asyncio.gather(
+        sleeper.get_league_users(args.league_id),
+        sleeper.get_league_rosters(args.league_id),
+    )
+    owner_ids = {r["owner_id"] for r in rosters}
+    owner_names = [u["display_name"] for u in users if u["user_id"] in owner_ids]
+    roster_ids = [r["roster_id"] for r in rosters]
+
+    paths = build_request_paths(
+        args.league_id, args.week, owner_names, roster_ids, parse_mix(args.mix), args.requests, seed=args.seed
+    )
+
+    if args.base_url:
+        http_client = httpx.AsyncClient(base_url=args.base_url, timeout=httpx.Timeout(120.0))
+    else:
+        # Run the app in-process so only the (replayed) Sleeper I/O and our own code are measured
+        app_module.client = sleeper
+        http_client = httpx.AsyncClient(transport=httpx.ASGITransport(app=app_module.app), base_url="http://loadtest")
+
+    async with http_client:
+        results, elapsed = await run_load(http_client, paths, args.concurrency)
+
+    summary = summarize(results, elapsed)
+    print_summary(summary, elapsed)
+    return summary
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Load test the power rankings API against recorded Sleeper data.")
+    parser.add_argument("--league-id", required=True)
+    parser.add_argument("--week", type=int, required=True, help="Highest week to request")
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=10)
+    parser.add_argument("--mix", default="rankings=5,trends=3,standings=2,season=1")
+    parser.add_argument("--record-dir", help="Record every Sleeper endpoint for weeks 1..--week to this directory, then exit")
+    parser.add_argument("--replay-dir", help="Replay Sleeper responses from this directory (otherwise SLEEPER_TRANSPORT must be set)")
+    parser.add_argument("--latency", type=float, default=0.0, help="Seconds of simulated Sleeper latency per request")
+    parser.add_argument("--jitter", type=float, default=0.0, help="Random +/- seconds added to the latency")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of Sleeper requests that fail with a 503")
+    parser.add_argument("--seed", type=int)
+    parser.add_argument("--base-url", help="Target a running server instead of the in-process app (its own SLEEPER_TRANSPORT decides where its Sleeper traffic goes)")
+    args = parser.parse_args(argv)
+
+    if args.record_dir and args.replay_dir:
+        parser.error("--record-dir and --replay-dir cannot be used together")
+    # Never fall back to the live API silently
+    if not args.record_dir and not args.replay_dir and "SLEEPER_TRANSPORT" not in os.environ:
+        parser.error("pass --replay-dir, or set SLEEPER_TRANSPORT explicitly to load test another transport")
+    return args
+
+
+if __name__ == "__main__":
+    asyncio.run(main(parse_args()))
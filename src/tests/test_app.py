@@ -1,3 +1,4 @@
+import json
 import pytest
 from fastapi.testclient import TestClient
 from src.app import app
@@ -88,3 +89,129 @@ def test_fetch_standings_endpoint(mock_matchups, mock_rosters, mock_base):
     assert "all_play" in data
     assert "rivals" in data
     assert data["rivals"][0]["wins"] == 1
+
+@patch('src.app.fetch_base_league_data', new_callable=AsyncMock)
+@patch('src.app.client.get_league_rosters', new_callable=AsyncMock)
+@patch('src.app.client.get_weekly_projections', new_callable=AsyncMock)
+@patch('src.app.client.get_matchups', new_callable=AsyncMock)
+def test_stream_trends_endpoint(mock_matchups, mock_projections, mock_rosters, mock_base):
+    mock_base.return_value = {
+        "league_info": {"season": "2025", "total_rosters": 2, "scoring_settings": {}},
+        "users": [{"user_id": "u1", "display_name": "User 1"}, {"user_id": "u2", "display_name": "User 2"}]
+    }
+    mock_rosters.return_value = [
+        {"roster_id": 1, "owner_id": "u1"},
+        {"roster_id": 2, "owner_id": "u2"}
+    ]
+    mock_projections.return_value = {}
+    mock_matchups.side_effect = lambda league_id, wk: [
+        {"roster_id": 1, "points": 100 if wk == 1 else 60, "starters": [], "matchup_id": 1},
+        {"roster_id": 2, "points": 80, "starters": [], "matchup_id": 1}
+    ]
+    
+    # Streaming trends endpoint: /trends/{league_id}/{target_owner_name}/{week}/stream
+    response = client.get("/trends/123456/User 1/2/stream")
+    
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/event-stream")
+    
+    events = [block for block in response.text.split("\n\n") if block]
+    points = [json.loads(block[len("data: "):]) for block in events if block.startswith("data: ")]
+    
+    assert [p["week"] for p in points] == [1, 2]
+    assert points[0]["rank"] == 1
+    assert events[-1].startswith("event: end")
+
+@patch('src.app.fetch_base_league_data', new_callable=AsyncMock)
+@patch('src.app.client.get_league_rosters', new_callable=AsyncMock)
+@patch('src.app.fetch_projections_up_to_week', new_callable=AsyncMock)
+@patch('src.app.fetch_matchups_up_to_week', new_callable=AsyncMock)
+def test_fetch_season_bundle_matches_weekly_endpoints(mock_matchups, mock_projections, mock_rosters, mock_base):
+    mock_base.return_value = {
+        "league_info": {"season": "2025", "total_rosters": 4, "scoring_settings": {"rec": 1.0}},
+        "users": [{"user_id": f"u{i}", "display_name": f"User {i}"} for i in range(1, 5)]
+    }
+    mock_rosters.return_value = [{"roster_id": i, "owner_id": f"u{i}"} for i in range(1, 5)]
+    
+    weekly_points = [[100, 80, 95, 110], [70, 120, 88, 90], [101, 99, 130, 60]]
+    all_matchups = [
+        [
+            {"roster_id": rid, "points": pts, "starters": [f"p{rid}"], "matchup_id": 1 if rid <= 2 else 2}
+            for rid, pts in zip(range(1, 5), week_points)
+        ]
+        for week_points in weekly_points
+    ]
+    all_projections = [{f"p{rid}": {"stats": {"rec": rid * wk}} for rid in range(1, 5)} for wk in range(1, 4)]
+    
+    mock_matchups.return_value = all_matchups
+    mock_projections.return_value = all_projections
+    bundle = client.get("/season/123456/3").json()
+    
+    assert bundle["weeks"] == [1, 2, 3]
+    assert bundle["owner_names"] == ["User 1", "User 2", "User 3", "User 4"]
+    assert bundle["weekly_points"] == weekly_points
+    
+    # Every week's slice of the bundle should match the per-week endpoints
+    for wk in (1, 3):
+        mock_matchups.return_value = all_matchups[:wk]
+        mock_projections.return_value = all_projections[:wk]
+        
+        rankings = client.get(f"/rankings/123456/{wk}").json()
+        for team in rankings:
+            idx = bundle["roster_ids"].index(team["roster_id"])
+            assert bundle["rankings"]["rank"][wk - 1][idx] == team["rank"]
+            assert bundle["rankings"]["power_index"][wk - 1][idx] == pytest.approx(team["power_index"])
+        
+        standings = client.get(f"/standings/123456/{wk}/1/2").json()
+        for team in standings["regular"]:
+            idx = bundle["roster_ids"].index(team["roster_id"])
+            assert bundle["regular"]["wins"][wk - 1][idx] == team["wins"]
+            assert bundle["regular"]["win_pct"][wk - 1][idx] == pytest.approx(team["win_pct"])
+        for team in standings["all_play"]:
+            idx = bundle["roster_ids"].index(team["roster_id"])
+            assert bundle["all_play"]["all_play_wins"][wk - 1][idx] == team["all_play_wins"]
+    
+    trends = client.get("/trends/123456/User 3/3").json()
+    assert [t["rank"] for t in trends] == [row[2] for row in bundle["trends"]["rank"]]
+
+@patch('src.app.fetch_base_league_data', new_callable=AsyncMock)
+@patch('src.app.client.get_league_rosters', new_callable=AsyncMock)
+@patch('src.app.client.get_weekly_projections', new_callable=AsyncMock)
+@patch('src.app.client.get_matchups', new_callable=AsyncMock)
+def test_stream_trends_fetches_weeks_in_pairs_and_reports_errors(mock_matchups, mock_projections, mock_rosters, mock_base):
+    mock_base.return_value = {
+        "league_info": {"season": "2025", "total_rosters": 2, "scoring_settings": {}},
+        "users": [{"user_id": "u1", "display_name": "User 1"}, {"user_id": "u2", "display_name": "User 2"}]
+    }
+    mock_rosters.return_value = [
+        {"roster_id": 1, "owner_id": "u1"},
+        {"roster_id": 2, "owner_id": "u2"}
+    ]
+    fetch_order = []
+    
+    def matchups(league_id, wk):
+        fetch_order.append(("matchups", wk))
+        if wk == 2:
+            raise RuntimeError("Sleeper is down")
+        return [
+            {"roster_id": 1, "points": 100, "starters": [], "matchup_id": 1},
+            {"roster_id": 2, "points": 80, "starters": [], "matchup_id": 1}
+        ]
+    
+    def projections(season, wk):
+        fetch_order.append(("projections", wk))
+        return {}
+    
+    mock_matchups.side_effect = matchups
+    mock_projections.side_effect = projections
+    
+    response = client.get("/trends/123456/User 1/3/stream")
+    
+    # Week 1's pair is queued ahead of every later week
+    assert fetch_order[:4] == [("matchups", 1), ("projections", 1), ("matchups", 2), ("projections", 2)]
+    
+    events = [block for block in response.text.split("\n\n") if block]
+    assert events[0].startswith("data: ")
+    assert json.loads(events[0][len("data: "):])["week"] == 1
+    assert events[-1].startswith("event: error")
+    assert "Sleeper is down" in events[-1]
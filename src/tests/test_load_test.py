@@ -0,0 +1,90 @@
+import json
+import pytest
+
+import src.app as app_module
+from src.api_clients.sleeper import SleeperAPIClient
+from src.api_clients.transports import RecordingTransport, ReplayTransport
+from src.load_test import build_request_paths, parse_args, parse_mix, main, record_league
+
+
+@pytest.fixture
+def recordings(tmp_path):
+    # Minimal two-team, two-week league laid out the way RecordingTransport writes it
+    files = {
+        "league/123456": {"season": "2025", "total_rosters": 2, "scoring_settings": {}},
+        "league/123456/users": [{"user_id": "u1", "display_name": "User 1"}, {"user_id": "u2", "display_name": "User 2"}],
+        "league/123456/rosters": [{"roster_id": 1, "owner_id": "u1"}, {"roster_id": 2, "owner_id": "u2"}],
+    }
+    for wk in (1, 2):
+        files[f"league/123456/matchups/{wk}"] = [
+            {"roster_id": 1, "points": 100 + wk, "starters": [], "matchup_id": 1},
+            {"roster_id": 2, "points": 90, "starters": [], "matchup_id": 1}
+        ]
+        files[f"projections/nfl/2025/{wk}"] = {}
+    
+    for endpoint, data in files.items():
+        path = tmp_path / f"{endpoint}.json"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(data))
+    
+    return tmp_path
+
+def test_parse_mix_rejects_unknown_route():
+    assert parse_mix("rankings=1,trends=2") == {"rankings": 1.0, "trends": 2.0}
+    
+    with pytest.raises(ValueError):
+        parse_mix("rankings=1,players=2")
+
+def test_build_request_paths_respects_mix():
+    paths = build_request_paths("123456", 3, ["User 1"], [1, 2], {"trends": 1}, 5, seed=1)
+    
+    assert len(paths) == 5
+    assert all(route == "trends" for route, _ in paths)
+    assert all(path.startswith("/trends/123456/User%201/") for _, path in paths)
+
+@pytest.mark.anyio
+@pytest.mark.parametrize('anyio_backend', ['asyncio'])
+async def test_load_test_replays_against_app(recordings, monkeypatch):
+    # main() swaps the replay client into the app; monkeypatch restores the original afterwards
+    monkeypatch.setattr(app_module, "client", app_module.client)
+    args = parse_args([
+        "--league-id", "123456", "--week", "2", "--requests", "12",
+        "--concurrency", "4", "--replay-dir", str(recordings), "--seed", "7",
+    ])
+    
+    summary = await main(args)
+    
+    overall = summary[-1]
+    assert overall["route"] == "all"
+    assert overall["requests"] == 12
+    assert overall["errors"] == 0
+    assert overall["p50_ms"] <= overall["p95_ms"] <= overall["p99_ms"]
+
+def test_parse_args_requires_an_explicit_transport(monkeypatch):
+    monkeypatch.delenv("SLEEPER_TRANSPORT", raising=False)
+    
+    with pytest.raises(SystemExit):
+        parse_args(["--league-id", "123456", "--week", "2"])
+
+@pytest.mark.anyio
+@pytest.mark.parametrize('anyio_backend', ['asyncio'])
+async def test_recorded_league_replays_every_route(recordings, tmp_path_factory, monkeypatch):
+    monkeypatch.setattr(app_module, "client", app_module.client)
+    recorded = tmp_path_factory.mktemp("recorded")
+    
+    # The fixture stands in for the live API behind the recorder
+    upstream = SleeperAPIClient(transport=RecordingTransport(recorded, inner=ReplayTransport(recordings)))
+    await record_league(upstream, "123456", 2)
+    
+    recorded_files = sorted(p.relative_to(recorded).as_posix() for p in recorded.rglob("*.json"))
+    assert recorded_files == sorted(p.relative_to(recordings).as_posix() for p in recordings.rglob("*.json"))
+    
+    args = parse_args([
+        "--league-id", "123456", "--week", "2", "--requests", "20",
+        "--mix", "rankings=1,trends=1,standings=1,season=1",
+        "--replay-dir", str(recorded), "--seed", "3",
+    ])
+    summary = await main(args)
+    
+    assert {row["route"] for row in summary} == {"rankings", "trends", "standings", "season", "all"}
+    assert summary[-1]["errors"] == 0
@@ -1,5 +1,9 @@
+import asyncio
+import json
+import httpx
 import pytest
 from src.api_clients.sleeper import SleeperAPIClient
+from src.api_clients.transports import RecordingTransport, ReplayTransport
 from unittest.mock import AsyncMock, patch, MagicMock
 
 @pytest.mark.anyio
@@ -37,3 +41,62 @@ async def test_get_matchups():
         
         assert result == mock_response
         assert "matchups/1" in mock_get.call_args[0][0]
+
+@pytest.mark.anyio
+async def test_recording_transport_round_trips_through_replay(tmp_path):
+    inner = MagicMock()
+    inner.fetch = AsyncMock(return_value=[{"roster_id": 1, "points": 150}])
+    
+    recorder = SleeperAPIClient(transport=RecordingTransport(tmp_path, inner=inner))
+    recorded = await recorder.get_matchups("123456", 1)
+    
+    assert (tmp_path / "league/123456/matchups/1.json").exists()
+    
+    replayer = SleeperAPIClient(transport=ReplayTransport(tmp_path))
+    assert await replayer.get_matchups("123456", 1) == recorded
+
+@pytest.mark.anyio
+async def test_replay_transport_missing_recording(tmp_path):
+    client = SleeperAPIClient(transport=ReplayTransport(tmp_path))
+    
+    with pytest.raises(FileNotFoundError):
+        await client.get_league_info("123456")
+
+@pytest.mark.anyio
+async def test_replay_transport_injects_errors(tmp_path):
+    (tmp_path / "league").mkdir()
+    (tmp_path / "league/123456.json").write_text(json.dumps({"name": "Test League"}))
+    
+    client = SleeperAPIClient(transport=ReplayTransport(tmp_path, error_rate=1.0, seed=1))
+    
+    with pytest.raises(httpx.HTTPStatusError) as exc_info:
+        await client.get_league_info("123456")
+    assert exc_info.value.response.status_code == 503
+
+@pytest.mark.anyio
+@pytest.mark.parametrize('anyio_backend', ['asyncio'])
+async def test_semaphore_limits_concurrent_requests(tmp_path):
+    (tmp_path / "projections/nfl/2025").mkdir(parents=True)
+    for wk in range(1, 11):
+        (tmp_path / f"projections/nfl/2025/{wk}.json").write_text("{}")
+    
+    transport = ReplayTransport(tmp_path, latency=0.01)
+    in_flight = 0
+    peak = 0
+    original_fetch = transport.fetch
+    
+    async def tracking_fetch(url, endpoint):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        try:
+            return await original_fetch(url, endpoint)
+        finally:
+            in_flight -= 1
+    
+    transport.fetch = tracking_fetch
+    client = SleeperAPIClient(transport=transport)
+    
+    await asyncio.gather(*(client.get_weekly_projections("2025", wk) for wk in range(1, 11)))
+    
+    assert peak == 5
@@ -151,35 +151,45 @@ def get_power_rankings(season_df, projections_df, weights=None):
     return ranked_df[['rank', 'roster_id', 'power_index', 'z_points', 'z_all_play_wins', 'z_projected_points']].round(4)   
 
 
+def calculate_trend_point(season_df, projections_df, target_roster_id, wk):
+    # Ranks the league using every week up to and including wk, then picks out the target roster
+    matchups_slice = season_df[season_df['week'] <= wk]
+    projections_slice = projections_df[projections_df['week'] <= wk]
+    
+    aggs_df = calculate_season_aggregates(matchups_slice)
+    
+    proj_aggs = projections_slice.groupby('roster_id')['projected_points'].sum().reset_index()
+    
+    rankings = get_power_rankings(aggs_df, proj_aggs)
+    
+    user_row = rankings[rankings['roster_id'] == target_roster_id]
+    
+    if user_row.empty:
+        return None
+    
+    return {
+        'week': wk,
+        'rank': int(user_row.iloc[0]['rank']),
+        'power_index': float(user_row.iloc[0]['power_index'])
+    }
+
+
 def calculate_trend_lines(season_df, projections_df, target_roster_id):   
     trend_data = []
     max_week = int(season_df['week'].max())
     
     for wk in range(1, max_week + 1):
-        matchups_slice = season_df[season_df['week'] <= wk]
-        projections_slice = projections_df[projections_df['week'] <= wk]
-        
-        aggs_df = calculate_season_aggregates(matchups_slice)
-        
-        proj_aggs = projections_slice.groupby('roster_id')['projected_points'].sum().reset_index()
-        
-        rankings = get_power_rankings(aggs_df, proj_aggs)
+        point = calculate_trend_point(season_df, projections_df, target_roster_id, wk)
         
-        user_row = rankings[rankings['roster_id'] == target_roster_id]
-        
-        if not user_row.empty:
-            trend_data.append({
-                'week': wk,
-                'rank': int(user_row.iloc[0]['rank']),
-                'power_index': float(user_row.iloc[0]['power_index'])
-            })
+        if point is not None:
+            trend_data.append(point)
             
     return pd.DataFrame(trend_data)
 
-def calculate_weekly_regular_standings(season_df):
+def calculate_head_to_head_results(season_df):
     """
-    Calculates cumulative H2H records (Wins, Losses, PF, PA)
-    from the data provided in season_df.
+    Pairs every team with its opponent for each week and flags
+    the result (Wins, Losses, Ties) of that single game.
     """
 
     opponents = season_df[['week', 'matchup_id', 'roster_id', 'points']].copy()
@@ -192,6 +202,16 @@ def calculate_weekly_regular_standings(season_df):
     merged_df['losses'] = merged_df['points'] < merged_df['opponent_points'].astype(int)
     merged_df['ties'] = merged_df['points'] == merged_df['opponent_points'].astype(int)
     
+    return merged_df
+
+def calculate_weekly_regular_standings(season_df):
+    """
+    Calculates cumulative H2H records (Wins, Losses, PF, PA)
+    from the data provided in season_df.
+    """
+
+    merged_df = calculate_head_to_head_results(season_df)
+    
     standings = merged_df.groupby('roster_id').agg({
         'wins': 'sum',
         'losses': 'sum',
@@ -235,3 +255,76 @@ def calculate_rival_standings(season_df, user_roster_id, rival_roster_id):
     standings['roster_id'] = u_id
     
     return standings.reset_index(drop=True)
+
+
+def calculate_season_bundle(season_df, projections_df):
+    """
+    Calculates rankings, trend points, regular and all-play standings for
+    every week 1..N in one cumulative pass over season_df.
+    
+    Results are columnar: each metric is a list with one row per week, and
+    each row lists that week's values in the same order as 'roster_ids'.
+    """
+    max_week = int(season_df['week'].max())
+    weeks = list(range(1, max_week + 1))
+    roster_ids = sorted(season_df['roster_id'].unique().tolist())
+    
+    # Week x roster grid of a column, with any missing week/roster filled with 0
+    def weekly_grid(df, column):
+        grid = df.pivot_table(index='week', columns='roster_id', values=column, aggfunc='sum', fill_value=0)
+        return grid.reindex(index=weeks, columns=roster_ids, fill_value=0)
+    
+    def to_rows(grid):
+        return grid.round(4).values.tolist()
+    
+    head_to_head = calculate_head_to_head_results(season_df)
+    head_to_head[['wins', 'losses', 'ties']] = head_to_head[['wins', 'losses', 'ties']].astype(int)
+    
+    season_totals = {col: weekly_grid(season_df, col).cumsum() for col in ['all_play_wins', 'all_play_losses', 'z_score', 'points']}
+    regular_totals = {col: weekly_grid(head_to_head, col).cumsum() for col in ['wins', 'losses', 'ties', 'points', 'opponent_points']}
+    
+    weekly_projections = weekly_grid(projections_df, 'projected_points')
+    season_projections = weekly_projections.cumsum()
+    
+    ranking_columns = ['rank', 'power_index', 'z_points', 'z_all_play_wins', 'z_projected_points']
+    rankings = {col: [] for col in ranking_columns}
+    trends = {'rank': [], 'power_index': []}
+    
+    for wk in weeks:
+        aggs_df = pd.DataFrame({'roster_id': roster_ids})
+        for col, grid in season_totals.items():
+            aggs_df[col] = grid.loc[wk].values
+        
+        # Rankings use only that week's projections, trends use the running total (same as /rankings and /trends)
+        week_proj = pd.DataFrame({'roster_id': roster_ids, 'projected_points': weekly_projections.loc[wk].values})
+        total_proj = pd.DataFrame({'roster_id': roster_ids, 'projected_points': season_projections.loc[wk].values})
+        
+        week_rankings = get_power_rankings(aggs_df, week_proj).set_index('roster_id').reindex(roster_ids)
+        trend_rankings = get_power_rankings(aggs_df, total_proj).set_index('roster_id').reindex(roster_ids)
+        
+        for col in ranking_columns:
+            rankings[col].append(week_rankings[col].tolist())
+        for col in trends:
+            trends[col].append(trend_rankings[col].tolist())
+    
+    rankings['rank'] = [[int(r) for r in row] for row in rankings['rank']]
+    trends['rank'] = [[int(r) for r in row] for row in trends['rank']]
+    
+    regular = {col: to_rows(grid) for col, grid in regular_totals.items()}
+    games = regular_totals['wins'] + regular_totals['losses'] + regular_totals['ties']
+    regular['win_pct'] = to_rows(((regular_totals['wins'] + regular_totals['ties'] * 0.5) / games.replace(0, 1)))
+    
+    all_play = {col: to_rows(season_totals[col]) for col in ['all_play_wins', 'all_play_losses']}
+    all_play_games = season_totals['all_play_wins'] + season_totals['all_play_losses']
+    all_play['win_pct'] = to_rows(season_totals['all_play_wins'] / all_play_games.replace(0, 1))
+    
+    return {
+        'weeks': weeks,
+        'roster_ids': roster_ids,
+        # Raw weekly points let the client build any rival record without another request
+        'weekly_points': to_rows(weekly_grid(season_df, 'points')),
+        'rankings': rankings,
+        'trends': trends,
+        'regular': regular,
+        'all_play': all_play,
+    }